@@ -3,6 +3,12 @@ import random
 import math
 import sys
 import os
+import json
+import time
+import queue
+import atexit
+import threading
+from collections import deque
 
 # Initialize Pygame
 pygame.init()
@@ -38,6 +44,11 @@ PURPLE = (138, 43, 226)
 GOLD = (255, 215, 0)
 DARK_BROWN = (101, 67, 33)
 
+# Level-of-detail tiers used when tables are drawn small (spectator wall)
+LOD_LOW = 0      # no hair strands, glow, hand labels, names or shadows
+LOD_MEDIUM = 1   # no hair strands, glow or hand labels
+LOD_FULL = 2     # everything, as in the normal game
+
 # Try to load Arabic font
 try:
     # Try to load system Arabic fonts
@@ -282,7 +293,7 @@ class Hand:
         else:
             self.glow_intensity = max(self.glow_intensity - 5, 0)
 
-    def draw(self, screen):
+    def draw(self, screen, detail=LOD_FULL):
         # Calculate hand position with slight sway
         sway_x = int(3 * math.sin(self.hand_angle))
         sway_y = int(2 * math.cos(self.hand_angle * 0.8))
@@ -290,7 +301,7 @@ class Hand:
         hand_y = self.y + sway_y
 
         # Draw glow effect if hovering
-        if self.glow_intensity > 0:
+        if self.glow_intensity > 0 and detail >= LOD_FULL:
             glow_color = (255, 255, 255, self.glow_intensity)
             for i in range(3):
                 radius = 20 + i * 5
@@ -300,7 +311,8 @@ class Hand:
                 screen.blit(glow_surface, (hand_x - radius, hand_y - radius))
 
         # Draw hand shadow
-        pygame.draw.circle(screen, (0, 0, 0, 50), (hand_x + 2, hand_y + 2), 18)
+        if detail >= LOD_MEDIUM:
+            pygame.draw.circle(screen, (0, 0, 0, 50), (hand_x + 2, hand_y + 2), 18)
 
         # Draw closed fist
         pygame.draw.circle(screen, PINK, (hand_x, hand_y), 18)
@@ -330,10 +342,11 @@ class Hand:
             pygame.draw.circle(screen, YELLOW, (hand_x, hand_y), 22 + pulse, 2)
 
         # Draw side label
-        side_text = "يمين" if self.side == "right" else "يسار"
-        label_surface = create_arabic_surface(side_text, ARABIC_FONT_SMALL, BLACK)
-        label_rect = label_surface.get_rect(center=(hand_x, hand_y + 35))
-        screen.blit(label_surface, label_rect)
+        if detail >= LOD_FULL:
+            side_text = "يمين" if self.side == "right" else "يسار"
+            label_surface = create_arabic_surface(side_text, ARABIC_FONT_SMALL, BLACK)
+            label_rect = label_surface.get_rect(center=(hand_x, hand_y + 35))
+            screen.blit(label_surface, label_rect)
 
     def is_clicked(self, pos):
         distance = math.sqrt((pos[0] - self.x) ** 2 + (pos[1] - self.y) ** 2)
@@ -386,7 +399,7 @@ class Player:
         for hand in self.hands:
             hand.update(sound_manager)
 
-    def draw_long_hair(self, screen):
+    def draw_long_hair(self, screen, detail=LOD_FULL):
         """Draw long hair for female characters"""
         if not self.is_female:
             return
@@ -395,22 +408,23 @@ class Player:
         hair_color = DARK_BROWN
 
         # Draw hair strands with wave animation
-        for i in range(12):
-            # Left side hair
-            wave_offset = int(5 * math.sin(self.hair_wave_timer + i * 0.3))
-            start_x = self.x - 35 + i * 3
-            start_y = self.y - 100
-            end_x = self.x - 60 + i * 2 + wave_offset
-            end_y = self.y - 20 + i * 8
+        if detail >= LOD_FULL:
+            for i in range(12):
+                # Left side hair
+                wave_offset = int(5 * math.sin(self.hair_wave_timer + i * 0.3))
+                start_x = self.x - 35 + i * 3
+                start_y = self.y - 100
+                end_x = self.x - 60 + i * 2 + wave_offset
+                end_y = self.y - 20 + i * 8
 
-            # Draw hair strand
-            pygame.draw.line(screen, hair_color, (start_x, start_y), (end_x, end_y), 3)
+                # Draw hair strand
+                pygame.draw.line(screen, hair_color, (start_x, start_y), (end_x, end_y), 3)
 
-            # Right side hair
-            start_x = self.x + 35 - i * 3
-            end_x = self.x + 60 - i * 2 - wave_offset
+                # Right side hair
+                start_x = self.x + 35 - i * 3
+                end_x = self.x + 60 - i * 2 - wave_offset
 
-            pygame.draw.line(screen, hair_color, (start_x, start_y), (end_x, end_y), 3)
+                pygame.draw.line(screen, hair_color, (start_x, start_y), (end_x, end_y), 3)
 
         # Draw hair behind head
         for i in range(8):
@@ -420,13 +434,14 @@ class Player:
             hair_y = self.y - 60 + int(25 * math.sin(angle)) + abs(wave)
             pygame.draw.circle(screen, hair_color, (hair_x, hair_y), 8)
 
-    def draw(self, screen):
+    def draw(self, screen, detail=LOD_FULL):
         # Draw shadow
-        pygame.draw.ellipse(screen, GRAY, (self.x - 48, self.y + 32, 96, 30))
+        if detail >= LOD_MEDIUM:
+            pygame.draw.ellipse(screen, GRAY, (self.x - 48, self.y + 32, 96, 30))
 
         # Draw long hair behind head for females
         if self.is_female:
-            self.draw_long_hair(screen)
+            self.draw_long_hair(screen, detail)
 
         # Draw body
         pygame.draw.ellipse(screen, self.color, (self.x - 50, self.y - 30, 100, 60))
@@ -469,12 +484,13 @@ class Player:
 
         # Draw hands
         for hand in self.hands:
-            hand.draw(screen)
+            hand.draw(screen, detail)
 
         # Draw name (Arabic)
-        name_surface = create_arabic_surface(self.name, ARABIC_FONT, BLACK)
-        name_rect = name_surface.get_rect(center=(self.x, self.y + 80))
-        screen.blit(name_surface, name_rect)
+        if detail >= LOD_MEDIUM:
+            name_surface = create_arabic_surface(self.name, ARABIC_FONT, BLACK)
+            name_rect = name_surface.get_rect(center=(self.x, self.y + 80))
+            screen.blit(name_surface, name_rect)
 
 
 # Arabic names and texts
@@ -508,6 +524,728 @@ ARABIC_TEXTS = {
 }
 
 
+
+# Round telemetry settings
+TELEMETRY_LOG = os.environ.get("MAHAYBES_TELEMETRY_LOG", "mahaybes_rounds.jsonl")
+TELEMETRY_MAX_BYTES = 5 * 1024 * 1024
+TELEMETRY_BACKUPS = 5
+TELEMETRY_QUEUE_SIZE = 1024
+TELEMETRY_BATCH_SIZE = 64
+TELEMETRY_FLUSH_INTERVAL = 1.0
+REACTION_BUCKET_MS = 50
+SESSION_WINDOW = 64
+
+
+def hand_id(hand):
+    """Stable text id for a hand, e.g. 'أحمد:left'"""
+    return f"{hand.player_name}:{hand.side}"
+
+
+class RoundTelemetry:
+    """Collect per-round events without blocking the frame loop.
+
+    Events go into a bounded queue; a background thread drains it and appends
+    them in batches to a line-delimited JSON log that rotates by size.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path=TELEMETRY_LOG, max_bytes=TELEMETRY_MAX_BYTES, backup_count=TELEMETRY_BACKUPS,
+                 queue_size=TELEMETRY_QUEUE_SIZE, batch_size=TELEMETRY_BATCH_SIZE,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enabled = path.lower() not in ("", "0", "off")
+        self.session_id = f"{int(time.time())}-{os.getpid()}"
+        self.round_number = 0
+        self.round_started = None
+        self.dropped = 0
+        self.closed = False
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        if self.enabled:
+            self._thread = threading.Thread(target=self._writer_loop, name="round-telemetry", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def round_started_event(self, ring_hand):
+        """Called from start_round once the ring has been hidden"""
+        self.round_number += 1
+        self.round_started = time.perf_counter()
+        self._record({
+            "e": "start",
+            "session": self.session_id,
+            "round": self.round_number,
+            "t": round(time.time(), 3),
+            "ring": hand_id(ring_hand),
+        })
+
+    def round_finished_event(self, ring_hand, guessed_hand):
+        """Called from handle_click once the player has picked a hand"""
+        reaction_ms = None
+        if self.round_started is not None:
+            reaction_ms = round((time.perf_counter() - self.round_started) * 1000, 1)
+        self._record({
+            "e": "result",
+            "session": self.session_id,
+            "round": self.round_number,
+            "t": round(time.time(), 3),
+            "ring": hand_id(ring_hand),
+            "guess": hand_id(guessed_hand),
+            "win": guessed_hand is ring_hand,
+            "reaction_ms": reaction_ms,
+        })
+
+    def _record(self, event):
+        if not self.enabled or self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # Never stall the game; count what we had to drop instead
+            self.dropped += 1
+
+    def _writer_loop(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if item is self._STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write_batch(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+    def _write_batch(self, batch):
+        lines = [(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                 for event in batch]
+        try:
+            size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            part = []
+            for line in lines:
+                # Rotate between lines so no file grows past max_bytes; a single
+                # line longer than max_bytes still gets a file of its own
+                if size and size + len(line) > self.max_bytes:
+                    self._append(part)
+                    part = []
+                    self._rotate()
+                    size = 0
+                part.append(line)
+                size += len(line)
+            self._append(part)
+        except OSError as e:
+            print(f"Could not write telemetry: {e}")
+
+    def _append(self, lines):
+        if lines:
+            with open(self.path, "ab") as log_file:
+                log_file.write(b"".join(lines))
+
+    def _rotate(self):
+        """Shift log -> log.1 -> log.2 ..., dropping the oldest backup"""
+        oldest = f"{self.path}.{self.backup_count}"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def close(self):
+        """Flush pending events and stop the writer thread"""
+        if self.closed:
+            return
+        self.closed = True
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(self._STOP, timeout=2.0)
+        except queue.Full:
+            print("Telemetry queue stuck, some events were not written")
+            return
+        self._thread.join(timeout=5.0)
+        if self.dropped:
+            print(f"Telemetry dropped {self.dropped} events (queue full)")
+
+
+def iter_round_log(path=TELEMETRY_LOG, backup_count=TELEMETRY_BACKUPS):
+    """Yield logged events one at a time, oldest rotated file first"""
+    paths = [f"{path}.{i}" for i in range(backup_count, 0, -1)] + [path]
+    for log_path in paths:
+        if not os.path.exists(log_path):
+            continue
+        with open(log_path, encoding="utf-8") as log_file:
+            for line in log_file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Skip a partially written line (e.g. after a crash)
+                    continue
+
+
+def summarize_round_log(path=TELEMETRY_LOG, backup_count=TELEMETRY_BACKUPS):
+    """Aggregate a round log in a single streaming pass.
+
+    Reaction time percentiles are estimated from fixed-width buckets, and
+    sessions are counted against a window of the SESSION_WINDOW most recently
+    seen ids, so memory does not grow with the number of rounds or sessions.
+    Games running at the same time can interleave their batches in one log;
+    the count stays exact as long as no more than SESSION_WINDOW sessions
+    overlap.
+    """
+    recent_sessions = {}
+    summary = {
+        "sessions": 0,
+        "rounds": 0,
+        "wins": 0,
+        "losses": 0,
+        "reaction_count": 0,
+        "reaction_total": 0.0,
+        "reaction_min": None,
+        "reaction_max": None,
+        "reaction_buckets": {},
+        "guesses": {},
+        "rings": {},
+    }
+    for event in iter_round_log(path, backup_count):
+        if event.get("e") != "result":
+            continue
+        session = event.get("session")
+        if session in recent_sessions:
+            # Move to the newest end of the window
+            del recent_sessions[session]
+        else:
+            summary["sessions"] += 1
+            if len(recent_sessions) >= SESSION_WINDOW:
+                del recent_sessions[next(iter(recent_sessions))]
+        recent_sessions[session] = True
+        summary["rounds"] += 1
+        if event.get("win"):
+            summary["wins"] += 1
+        else:
+            summary["losses"] += 1
+        guess = event.get("guess")
+        ring = event.get("ring")
+        summary["guesses"][guess] = summary["guesses"].get(guess, 0) + 1
+        summary["rings"][ring] = summary["rings"].get(ring, 0) + 1
+
+        reaction = event.get("reaction_ms")
+        if reaction is not None:
+            summary["reaction_count"] += 1
+            summary["reaction_total"] += reaction
+            if summary["reaction_min"] is None or reaction < summary["reaction_min"]:
+                summary["reaction_min"] = reaction
+            if summary["reaction_max"] is None or reaction > summary["reaction_max"]:
+                summary["reaction_max"] = reaction
+            bucket = int(reaction // REACTION_BUCKET_MS)
+            summary["reaction_buckets"][bucket] = summary["reaction_buckets"].get(bucket, 0) + 1
+
+    return summary
+
+
+def bucket_percentile(buckets, count, percent):
+    """Approximate percentile (upper bucket edge, in ms) from a bucket histogram"""
+    if count == 0:
+        return None
+    target = count * percent / 100
+    seen = 0
+    for bucket in sorted(buckets):
+        seen += buckets[bucket]
+        if seen >= target:
+            return (bucket + 1) * REACTION_BUCKET_MS
+    return None
+
+
+def print_round_report(path=TELEMETRY_LOG, backup_count=TELEMETRY_BACKUPS):
+    """Print a short summary of the round log"""
+    summary = summarize_round_log(path, backup_count)
+    print(f"Telemetry log: {path}")
+    print(f"Sessions: {summary['sessions']}  Rounds: {summary['rounds']}  "
+          f"Wins: {summary['wins']}  Losses: {summary['losses']}")
+    if summary["rounds"]:
+        print(f"Win rate: {100 * summary['wins'] / summary['rounds']:.1f}%")
+    count = summary["reaction_count"]
+    if count:
+        buckets = summary["reaction_buckets"]
+        print(f"Reaction ms: mean {summary['reaction_total'] / count:.1f}  "
+              f"min {summary['reaction_min']:.1f}  max {summary['reaction_max']:.1f}  "
+              f"p50 <={bucket_percentile(buckets, count, 50)}  "
+              f"p95 <={bucket_percentile(buckets, count, 95)}")
+    for guess, total in sorted(summary["guesses"].items(), key=lambda item: -item[1]):
+        print(f"  guessed {guess}: {total}")
+
+
+# Input latency instrumentation settings
+LATENCY_DUMP = os.environ.get("MAHAYBES_LATENCY_DUMP", "mahaybes_latency.json")
+LATENCY_SAMPLES = 2000
+LATENCY_OVERLAY_REFRESH = 0.5
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(0, math.ceil(len(sorted_values) * percent / 100) - 1)
+    return sorted_values[rank]
+
+
+class LatencyTracker:
+    """Measure input-to-photon latency.
+
+    Game input (left clicks and the Space key) is stamped when it is taken
+    off the event queue, again when start_round/handle_click acts on it, and
+    finally when the display.flip() that shows the result returns. Game input
+    that changed nothing (a click beside the hands, Space mid-round) goes to
+    the "unhandled" series. Time spent sleeping in clock.tick is tracked too,
+    since input arriving then waits for the next frame.
+    """
+
+    SERIES = ("photon", "handle", "render", "unhandled", "tick")
+    COLUMNS = ("p50", "p95", "p99", "count")
+
+    def __init__(self, dump_path=LATENCY_DUMP, max_samples=LATENCY_SAMPLES):
+        self.dump_path = dump_path
+        self.samples = {name: deque(maxlen=max_samples) for name in self.SERIES}
+        self.unhandled_inputs = {}
+        self.pending = []
+        self.current = None
+        self.show_overlay = False
+        self._panel = None
+        self._panel_due = 0
+
+    def input_received(self, event):
+        """Stamp a game input event as it comes off the queue"""
+        if event.type == pygame.KEYDOWN:
+            kind = pygame.key.name(event.key)
+        else:
+            kind = pygame.event.event_name(event.type)
+        self.current = {"kind": kind, "received": time.perf_counter(), "acted": None}
+        self.pending.append(self.current)
+
+    def input_acted(self):
+        """Stamp the input currently being handled as having changed the game"""
+        if self.current is not None and self.current["acted"] is None:
+            self.current["acted"] = time.perf_counter()
+
+    def frame_presented(self):
+        """Call right after display.flip() returns"""
+        self.current = None
+        if not self.pending:
+            return
+        presented = time.perf_counter()
+        for sample in self.pending:
+            if sample["acted"] is None:
+                self.samples["unhandled"].append((presented - sample["received"]) * 1000)
+                self.unhandled_inputs[sample["kind"]] = self.unhandled_inputs.get(sample["kind"], 0) + 1
+                continue
+            self.samples["photon"].append((presented - sample["received"]) * 1000)
+            self.samples["handle"].append((sample["acted"] - sample["received"]) * 1000)
+            self.samples["render"].append((presented - sample["acted"]) * 1000)
+        self.pending.clear()
+
+    def tick_waited(self, milliseconds):
+        """Record how long clock.tick slept this frame"""
+        self.samples["tick"].append(milliseconds)
+
+    def stats(self):
+        result = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            result[name] = {
+                "count": len(ordered),
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "mean": sum(ordered) / len(ordered) if ordered else None,
+                "max": ordered[-1] if ordered else None,
+            }
+        return result
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self._panel = None
+        return self.show_overlay
+
+    def draw_overlay(self, screen):
+        """Draw latency percentiles in the top-left corner.
+
+        The panel is rebuilt at most every LATENCY_OVERLAY_REFRESH seconds so
+        the overlay adds little to the render time it is reporting.
+        """
+        now = time.perf_counter()
+        if self._panel is None or now >= self._panel_due:
+            self._panel = self._build_panel(self.stats())
+            self._panel_due = now + LATENCY_OVERLAY_REFRESH
+        screen.blit(self._panel, (25, 25))
+
+    def _build_panel(self, stats):
+        # The font is proportional, so each column is right-aligned at a fixed x
+        name_x, first_column_x, column_width = 8, 190, 65
+        rows = [("latency ms",) + self.COLUMNS]
+        for name in self.SERIES:
+            row = stats[name]
+            if row["count"]:
+                rows.append((name, f"{row['p50']:.1f}", f"{row['p95']:.1f}", f"{row['p99']:.1f}", str(row["count"])))
+            else:
+                rows.append((name, "-", "-", "-", "0"))
+
+        line_height = ARABIC_FONT_SMALL.get_linesize()
+        panel = pygame.Surface((first_column_x + column_width * (len(self.COLUMNS) - 1) + 8,
+                                line_height * len(rows) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, row in enumerate(rows):
+            y = 5 + i * line_height
+            panel.blit(ARABIC_FONT_SMALL.render(row[0], True, WHITE), (name_x, y))
+            for j, cell in enumerate(row[1:]):
+                cell_surface = ARABIC_FONT_SMALL.render(cell, True, WHITE)
+                panel.blit(cell_surface, cell_surface.get_rect(topright=(first_column_x + j * column_width, y)))
+        return panel
+
+    def dump(self):
+        """Write percentiles and raw samples to the dump file"""
+        if not any(self.samples[name] for name in self.SERIES if name != "tick"):
+            return
+        report = {
+            "generated": round(time.time(), 3),
+            "fps_target": FPS,
+            "stats": self.stats(),
+            "unhandled_inputs": self.unhandled_inputs,
+            "samples": {name: [round(v, 3) for v in values] for name, values in self.samples.items()},
+        }
+        try:
+            with open(self.dump_path, "w", encoding="utf-8") as dump_file:
+                json.dump(report, dump_file, indent=2)
+            print(f"Latency report written to {self.dump_path}")
+        except OSError as e:
+            print(f"Could not write latency report: {e}")
+
+
+# In-game profiler settings
+PROFILE_MODES = ("cprofile", "sample")
+
+
+def profile_seconds_from_env():
+    """Startup capture length from MAHAYBES_PROFILE; 0 (off) if unset or invalid"""
+    value = os.environ.get("MAHAYBES_PROFILE", "")
+    try:
+        seconds = float(value or 0)
+    except ValueError:
+        seconds = -1
+    if not math.isfinite(seconds) or seconds < 0:
+        print(f"Ignoring MAHAYBES_PROFILE={value!r}: expected a positive number of seconds")
+        return 0
+    return seconds
+
+
+def profile_mode_from_env():
+    """Profiler mode from MAHAYBES_PROFILER; "cprofile" if unset or unknown"""
+    mode = os.environ.get("MAHAYBES_PROFILER", PROFILE_MODES[0])
+    if mode not in PROFILE_MODES:
+        print(f"Ignoring MAHAYBES_PROFILER={mode!r}: expected one of {', '.join(PROFILE_MODES)}")
+        return PROFILE_MODES[0]
+    return mode
+
+
+PROFILE_SECONDS = profile_seconds_from_env()
+PROFILE_MODE = profile_mode_from_env()
+PROFILE_DIR = os.environ.get("MAHAYBES_PROFILE_DIR", ".")
+PROFILE_DEFAULT_SECONDS = 10
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_HUD_SECONDS = 10
+PROFILE_HUD_LINES = 6
+PROFILE_MAX_DEPTH = 64
+
+
+class FrameProfiler:
+    """Bounded profiling capture for the game loop.
+
+    Nothing is hooked in until a capture starts, and the loop only checks
+    `active`, so the profiler can stay in production builds. In "cprofile"
+    mode cProfile records exact per-function times (written as pstats) and
+    the collapsed stacks for flame-graph tools are derived from its
+    caller/callee totals. In "sample" mode cProfile is off and a thread
+    samples the main thread's stack instead, which costs less but only
+    produces collapsed stacks.
+    """
+
+    def __init__(self, output_dir=PROFILE_DIR, mode=PROFILE_MODE, interval=PROFILE_SAMPLE_INTERVAL):
+        if mode not in PROFILE_MODES:
+            print(f"Unknown profiler mode {mode!r}, using {PROFILE_MODES[0]}")
+            mode = PROFILE_MODES[0]
+        self.output_dir = output_dir
+        self.mode = mode
+        self.interval = interval
+        self.active = False
+        self.deadline = 0
+        self.hud_lines = []
+        self.hud_until = 0
+        self._hud_panel = None
+        self._hud_text = None
+        self._profile = None
+        self._sampler = None
+        self._stop_sampling = None
+        self._samples = {}
+        self._captures = 0
+
+    def start(self, seconds=PROFILE_DEFAULT_SECONDS):
+        """Profile the calling thread for the next `seconds` seconds"""
+        if self.active:
+            return
+        if not (math.isfinite(seconds) and seconds > 0):
+            print(f"Invalid profile length {seconds!r}, using {PROFILE_DEFAULT_SECONDS} s")
+            seconds = PROFILE_DEFAULT_SECONDS
+        self._samples = {}
+        self._hud_panel = None
+        self._hud_text = None
+        if self.mode == "cprofile":
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._stop_sampling = threading.Event()
+            self._sampler = threading.Thread(target=self._sample_loop, args=(threading.get_ident(),),
+                                             name="frame-profiler", daemon=True)
+            self._sampler.start()
+        self.deadline = time.perf_counter() + seconds
+        self.active = True
+        print(f"Profiling for {seconds:g} s ({self.mode})")
+
+    def check(self):
+        """Call once per frame while active; ends the capture when time is up"""
+        if time.perf_counter() >= self.deadline:
+            self.stop()
+
+    def stop(self):
+        if not self.active:
+            return
+        if self._profile is not None:
+            self._profile.disable()
+            import pstats
+            self._samples = self._collapse_profile(pstats.Stats(self._profile).stats)
+        else:
+            self._stop_sampling.set()
+            self._sampler.join()
+        self.active = False
+
+        # Milliseconds and a per-session counter keep quick captures apart
+        now = time.time()
+        self._captures += 1
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        base = os.path.join(self.output_dir,
+                            f"mahaybes_profile_{stamp}_{int(now * 1000) % 1000:03d}_{self._captures}")
+        try:
+            if self._profile is not None:
+                self._profile.dump_stats(base + ".pstats")
+            with open(base + ".collapsed", "w", encoding="utf-8") as collapsed_file:
+                for stack, count in sorted(self._samples.items()):
+                    collapsed_file.write(f"{stack} {count}\n")
+            print(f"Profile written to {base}.*")
+        except OSError as e:
+            print(f"Could not write profile: {e}")
+
+        self.hud_lines = self._slowest_functions()
+        self.hud_until = time.perf_counter() + PROFILE_HUD_SECONDS
+        self._hud_panel = self._build_hud_panel(["slowest functions (self time)"] + self.hud_lines)
+        self._profile = None
+
+    @staticmethod
+    def _label(path, line, name):
+        if path == "~":  # built-in functions have no source location
+            return name
+        return f"{name} ({os.path.basename(path)}:{line})"
+
+    def _sample_loop(self, thread_id):
+        while not self._stop_sampling.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(self._label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                self._samples[key] = self._samples.get(key, 0) + 1
+
+    def _collapse_profile(self, stats):
+        """Build collapsed stacks (weights in microseconds) from cProfile stats.
+
+        cProfile only keeps direct callers, so a function's time is split
+        between its call paths in proportion to the time each caller spent in
+        it. That is an estimate, but it needs no extra sampling thread.
+        """
+        children = {}
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller, edge in callers.items():
+                children.setdefault(caller, []).append((func, edge[3]))
+
+        stacks = {}
+
+        def walk(func, share, path, seen):
+            _, _, own, total, _ = stats[func]
+            path = path + [self._label(*func)]
+            weight = int(own * share * 1000000)
+            if weight > 0:
+                key = ";".join(path)
+                stacks[key] = stacks.get(key, 0) + weight
+            if len(path) >= PROFILE_MAX_DEPTH:
+                return
+            for child, edge_total in children.get(func, ()):
+                child_total = stats[child][3]
+                if child in seen or child_total <= 0:
+                    continue
+                walk(child, share * edge_total / child_total, path, seen | {child})
+
+        # Functions with no recorded caller were called from frames entered
+        # before the capture started (e.g. MahaybesGame.run itself)
+        for func, row in stats.items():
+            if not row[4]:
+                walk(func, 1.0, [], {func})
+        return stacks
+
+    def _slowest_functions(self):
+        """HUD lines for the functions with the most self time"""
+        if self._profile is not None:
+            import pstats
+            stats = pstats.Stats(self._profile).stats
+            ranked = sorted(stats.items(), key=lambda item: -item[1][2])
+            return [f"{own * 1000:8.1f} ms  {self._label(*func)}"
+                    for func, (_, _, own, _, _) in ranked[:PROFILE_HUD_LINES]]
+
+        # Sampling only: attribute each sample to the innermost frame
+        own_samples = {}
+        for stack, count in self._samples.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            own_samples[leaf] = own_samples.get(leaf, 0) + count
+        ranked = sorted(own_samples.items(), key=lambda item: -item[1])
+        return [f"{count * self.interval * 1000:8.1f} ms  {leaf}" for leaf, count in ranked[:PROFILE_HUD_LINES]]
+
+    def hud_visible(self):
+        return self.active or (self.hud_lines and time.perf_counter() < self.hud_until)
+
+    def draw_hud(self, screen):
+        """Draw capture progress, or the slowest functions of the last capture.
+
+        Panels are cached: the results panel is built once in stop(), and the
+        countdown only when its displayed tenth of a second changes, so the
+        HUD stays out of the profile and the latency samples.
+        """
+        if self.active:
+            text = f"PROFILING ({self.mode}) {max(0.0, self.deadline - time.perf_counter()):.1f} s"
+            if text != self._hud_text:
+                self._hud_text = text
+                self._hud_panel = self._build_hud_panel([text])
+        screen.blit(self._hud_panel, (WIDTH - self._hud_panel.get_width() - 25, 25))
+
+    def _build_hud_panel(self, lines):
+        line_height = ARABIC_FONT_SMALL.get_linesize()
+        rendered = [ARABIC_FONT_SMALL.render(line, True, WHITE) for line in lines]
+        panel = pygame.Surface((max(surface.get_width() for surface in rendered) + 16,
+                                line_height * len(lines) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (8, 5 + i * line_height))
+        return panel
+
+
+class RoundState:
+    """Round logic for one table: where the ring is and which hand was picked.
+
+    Has no display or sound, so the game and every spectator table share it.
+    """
+
+    def __init__(self, hands):
+        self.hands = hands
+        self.game_state = "waiting"
+        self.ring_hand = None
+        self.selected_hand = None
+        self.current_message = 'start'
+        self.winner_info = ""
+
+    def can_start(self):
+        return self.game_state in ["waiting", "result"]
+
+    def start_round(self):
+        # Reset all hands
+        for hand in self.hands:
+            hand.has_ring = False
+            hand.selected = False
+
+        # Randomly select which hand has the ring
+        self.ring_hand = random.choice(self.hands)
+        self.ring_hand.has_ring = True
+        self.selected_hand = None
+
+        self.game_state = "hiding"
+        self.current_message = 'hidden'
+
+    def guess(self, hand):
+        """Pick a hand while the ring is hidden; returns True if it had the ring"""
+        self.selected_hand = hand
+        hand.selected = True
+        self.game_state = "result"
+
+        # Create winner info text
+        side_text = "اليمين" if self.ring_hand.side == "right" else "اليسار"
+        self.winner_info = f"{side_text} {self.ring_hand.player_name}"
+
+        won = hand == self.ring_hand
+        self.current_message = 'correct' if won else 'wrong'
+        return won
+
+
+def create_players():
+    """Create the four players seated around a table"""
+    return [
+        Player(300, 300, 'أحمد', BLUE, is_female=False),
+        Player(900, 300, 'فرح', GREEN, is_female=True),
+        Player(300, 600, 'محمد', RED, is_female=False),
+        Player(900, 600, 'زينب', ORANGE, is_female=True)
+    ]
+
+
+def draw_gradient_background(surface, color1, color2):
+    """Draw a vertical gradient filling the whole surface"""
+    width, height = surface.get_size()
+    for y in range(height):
+        ratio = y / height
+        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+
+
+def draw_traditional_border(surface):
+    """Draw traditional Islamic geometric border around the surface"""
+    width, height = surface.get_size()
+
+    # Draw decorative border
+    pygame.draw.rect(surface, BROWN, (10, 10, width - 20, height - 20), 5)
+    pygame.draw.rect(surface, YELLOW, (15, 15, width - 30, height - 30), 2)
+
+    # Draw corner decorations
+    corners = [(30, 30), (width - 30, 30), (30, height - 30), (width - 30, height - 30)]
+    for corner in corners:
+        pygame.draw.circle(surface, BROWN, corner, 15)
+        pygame.draw.circle(surface, YELLOW, corner, 10)
+
+
 class MahaybesGame:
     def __init__(self):
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -521,24 +1259,24 @@ class MahaybesGame:
         self.bg_color1 = (250, 248, 240)
         self.bg_color2 = (245, 245, 220)
 
+        # Session-wide services, kept when R restarts the game
+        self.telemetry = RoundTelemetry()
+        self.latency = LatencyTracker()
+        self.profiler = FrameProfiler()
+
+        self.reset()
+
+    def reset(self):
+        """Start a fresh game with new players (R key)"""
         # Create players with Arabic names - females have long hair
-        self.players = [
-            Player(300, 300, 'أحمد', BLUE, is_female=False),
-            Player(900, 300, 'فرح', GREEN, is_female=True),
-            Player(300, 600, 'محمد', RED, is_female=False),
-            Player(900, 600, 'زينب', ORANGE, is_female=True)
-        ]
+        self.players = create_players()
 
         # Collect all hands
         self.all_hands = []
         for player in self.players:
             self.all_hands.extend(player.hands)
 
-        self.game_state = "waiting"
-        self.ring_hand = None
-        self.selected_hand = None
-        self.current_message = 'start'
-        self.winner_info = ""
+        self.round = RoundState(self.all_hands)
         self.animation_timer = 0
         self.show_ring_animation = False
         self.mouse_pos = (0, 0)
@@ -546,66 +1284,41 @@ class MahaybesGame:
 
     def draw_gradient_background(self):
         """Draw a gradient background"""
-        for y in range(HEIGHT):
-            ratio = y / HEIGHT
-            r = int(self.bg_color1[0] * (1 - ratio) + self.bg_color2[0] * ratio)
-            g = int(self.bg_color1[1] * (1 - ratio) + self.bg_color2[1] * ratio)
-            b = int(self.bg_color1[2] * (1 - ratio) + self.bg_color2[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (WIDTH, y))
+        draw_gradient_background(self.screen, self.bg_color1, self.bg_color2)
 
     def draw_traditional_border(self):
         """Draw traditional Islamic geometric border"""
-        # Draw decorative border
-        pygame.draw.rect(self.screen, BROWN, (10, 10, WIDTH - 20, HEIGHT - 20), 5)
-        pygame.draw.rect(self.screen, YELLOW, (15, 15, WIDTH - 30, HEIGHT - 30), 2)
-
-        # Draw corner decorations
-        corners = [(30, 30), (WIDTH - 30, 30), (30, HEIGHT - 30), (WIDTH - 30, HEIGHT - 30)]
-        for corner in corners:
-            pygame.draw.circle(self.screen, BROWN, corner, 15)
-            pygame.draw.circle(self.screen, YELLOW, corner, 10)
+        draw_traditional_border(self.screen)
 
     def start_round(self):
-        # Reset all hands
-        for hand in self.all_hands:
-            hand.has_ring = False
-            hand.selected = False
-
-        # Randomly select which hand has the ring
-        self.ring_hand = random.choice(self.all_hands)
-        self.ring_hand.has_ring = True
-
-        self.game_state = "hiding"
-        self.current_message = 'hidden'
+        self.round.start_round()
         self.animation_timer = 0
         self.show_ring_animation = False
 
+        self.latency.input_acted()
+        self.telemetry.round_started_event(self.round.ring_hand)
+
         # Play start sound
         self.sound_manager.play_sound('start')
 
     def handle_click(self, pos):
-        if self.game_state == "hiding":
+        if self.round.game_state == "hiding":
             # Check if clicked on any hand
             for hand in self.all_hands:
                 if hand.is_clicked(pos):
-                    self.selected_hand = hand
-                    hand.selected = True
-                    self.game_state = "result"
+                    won = self.round.guess(hand)
                     self.show_ring_animation = True
                     self.animation_timer = 0
 
                     # Play click sound
                     self.sound_manager.play_sound('click')
 
-                    # Create winner info text
-                    side_text = "اليمين" if self.ring_hand.side == "right" else "اليسار"
-                    self.winner_info = f"{side_text} {self.ring_hand.player_name}"
+                    self.latency.input_acted()
+                    self.telemetry.round_finished_event(self.round.ring_hand, hand)
 
-                    if hand == self.ring_hand:
-                        self.current_message = 'correct'
+                    if won:
                         self.sound_manager.play_sound('success')
                     else:
-                        self.current_message = 'wrong'
                         self.sound_manager.play_sound('failure')
                     break
 
@@ -613,7 +1326,7 @@ class MahaybesGame:
         self.mouse_pos = pos
         # Update hover state for all hands
         for hand in self.all_hands:
-            hand.hover = hand.is_hovered(pos) and self.game_state == "hiding"
+            hand.hover = hand.is_hovered(pos) and self.round.game_state == "hiding"
 
     def draw_arabic_text(self, text, pos, font, color=BLACK):
         """Draw Arabic text on screen"""
@@ -649,35 +1362,40 @@ class MahaybesGame:
     def draw_message(self):
         # Draw current message with animation
         message_y = 120
+        current_message = self.round.current_message
+        winner_info = self.round.winner_info
+        ring_hand = self.round.ring_hand
 
-        if self.current_message == 'correct':
+        if current_message == 'correct':
             self.draw_arabic_text(ARABIC_TEXTS['correct'], (WIDTH // 2 - 100, message_y), ARABIC_FONT, GREEN)
-            self.draw_arabic_text(self.winner_info, (WIDTH // 2 + 80, message_y), ARABIC_FONT, GREEN)
+            self.draw_arabic_text(winner_info, (WIDTH // 2 + 80, message_y), ARABIC_FONT, GREEN)
 
-        elif self.current_message == 'wrong':
+        elif current_message == 'wrong':
             self.draw_arabic_text(ARABIC_TEXTS['wrong'], (WIDTH // 2 - 100, message_y), ARABIC_FONT, RED)
-            self.draw_arabic_text(self.winner_info, (WIDTH // 2 + 80, message_y), ARABIC_FONT, RED)
+            self.draw_arabic_text(winner_info, (WIDTH // 2 + 80, message_y), ARABIC_FONT, RED)
 
-        elif self.current_message == 'start':
+        elif current_message == 'start':
             pulse = int(5 * math.sin(pygame.time.get_ticks() * 0.005))
             color_intensity = 100 + pulse * 10
             pulse_color = (0, 0, min(255, color_intensity))
             self.draw_arabic_text(ARABIC_TEXTS['start'], (WIDTH // 2, message_y), ARABIC_FONT, pulse_color)
 
         else:
-            self.draw_arabic_text(ARABIC_TEXTS[self.current_message], (WIDTH // 2, message_y), ARABIC_FONT)
+            self.draw_arabic_text(ARABIC_TEXTS[current_message], (WIDTH // 2, message_y), ARABIC_FONT)
 
             # Draw ring indicator
-        if self.game_state == "result" and self.ring_hand and self.show_ring_animation:
+        if self.round.game_state == "result" and ring_hand and self.show_ring_animation:
             self.animation_timer += 1
-            ring_y = self.ring_hand.y - 40 + int(8 * math.sin(self.animation_timer * 0.08))
+            ring_y = ring_hand.y - 40 + int(8 * math.sin(self.animation_timer * 0.08))
             ring_radius = 20 + int(3 * math.sin(self.animation_timer * 0.1))
-            pygame.draw.circle(self.screen, GOLD, (self.ring_hand.x, ring_y), ring_radius, 4)
-            pygame.draw.circle(self.screen, YELLOW, (self.ring_hand.x, ring_y), ring_radius - 5, 3)
-            pygame.draw.circle(self.screen, RED, (self.ring_hand.x, ring_y), 8)
-            pygame.draw.circle(self.screen, WHITE, (self.ring_hand.x - 3, ring_y - 3), 3)
+            pygame.draw.circle(self.screen, GOLD, (ring_hand.x, ring_y), ring_radius, 4)
+            pygame.draw.circle(self.screen, YELLOW, (ring_hand.x, ring_y), ring_radius - 5, 3)
+            pygame.draw.circle(self.screen, RED, (ring_hand.x, ring_y), 8)
+            pygame.draw.circle(self.screen, WHITE, (ring_hand.x - 3, ring_y - 3), 3)
 
     def run(self):
+            if PROFILE_SECONDS > 0:
+                self.profiler.start(PROFILE_SECONDS)
             running = True
             while running:
                 for event in pygame.event.get():
@@ -685,14 +1403,22 @@ class MahaybesGame:
                         running = False
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_SPACE:
-                            if self.game_state in ["waiting", "result"]:
+                            self.latency.input_received(event)
+                            if self.round.can_start():
                                 self.start_round()
                         elif event.key == pygame.K_r:
-                            self.__init__()
+                            self.reset()
                         elif event.key == pygame.K_m:
                             status = self.sound_manager.toggle_sound()
                             self.sound_status_timer = pygame.time.get_ticks()
+                        elif event.key == pygame.K_F3:
+                            self.latency.toggle_overlay()
+                        elif event.key == pygame.K_F4:
+                            self.latency.dump()
+                        elif event.key == pygame.K_F9:
+                            self.profiler.start(PROFILE_SECONDS if PROFILE_SECONDS > 0 else PROFILE_DEFAULT_SECONDS)
                     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        self.latency.input_received(event)
                         self.handle_click(event.pos)
                     elif event.type == pygame.MOUSEMOTION:
                         self.handle_mouse_motion(event.pos)
@@ -714,12 +1440,355 @@ class MahaybesGame:
                     text = ARABIC_TEXTS['sound_on'] if self.sound_manager.sound_enabled else ARABIC_TEXTS['sound_off']
                     self.draw_arabic_text(text, (WIDTH // 2, 160), ARABIC_FONT_SMALL, PURPLE)
 
+                if self.latency.show_overlay:
+                    self.latency.draw_overlay(self.screen)
+                if self.profiler.hud_visible():
+                    self.profiler.draw_hud(self.screen)
+
                 pygame.display.flip()
+                self.latency.frame_presented()
+                tick_start = time.perf_counter()
                 self.clock.tick(FPS)
+                self.latency.tick_waited((time.perf_counter() - tick_start) * 1000)
 
+                if self.profiler.active:
+                    self.profiler.check()
+
+            self.profiler.stop()
+            self.latency.dump()
+            self.telemetry.close()
             pygame.quit()
             sys.exit()
+
+
+# Spectator wall settings
+SPECTATOR_BG_COLORS = ((250, 248, 240), (245, 245, 220))
+SPECTATOR_BENCH_COUNTS = (16, 25, 36, 49, 64)
+SPECTATOR_BENCH_FRAMES = 300
+SPECTATOR_EYE_PHASES = 8
+
+# What still moves on tiles drawn from cached sprites
+SPECTATOR_LOD_NOTES = {
+    LOD_FULL: "full: everything animates every frame",
+    LOD_MEDIUM: f"medium: blinks, pupils ({SPECTATOR_EYE_PHASES} steps) and ring bob animate; hands and hair are static",
+    LOD_LOW: "low: only the ring bob animates; players are static",
+}
+
+
+def lod_for_scale(scale):
+    """Pick a level of detail for a table drawn at the given scale"""
+    if scale >= 0.45:
+        return LOD_FULL
+    if scale >= 0.2:
+        return LOD_MEDIUM
+    return LOD_LOW
+
+
+class SpectatorSpriteCache:
+    """Pre-scaled table pieces shared by every table on the spectator wall.
+
+    Players are rendered once per (look, blink, pupil step, detail, scale)
+    at full size and smooth-scaled down, so small tiles only blit a handful
+    of surfaces. Pupils move in SPECTATOR_EYE_PHASES steps; hands and hair
+    are drawn at rest.
+    """
+
+    # Player bounding box relative to Player.x/Player.y
+    SPRITE_SIZE = (220, 210)
+    SPRITE_ORIGIN = (110, 110)
+
+    def __init__(self):
+        self.sprites = {}
+        self.backgrounds = {}
+        self.texts = {}
+        self.canvas = None
+
+    def background(self, size):
+        if size not in self.backgrounds:
+            full = pygame.Surface((WIDTH, HEIGHT))
+            draw_gradient_background(full, *SPECTATOR_BG_COLORS)
+            draw_traditional_border(full)
+            if size != (WIDTH, HEIGHT):
+                full = pygame.transform.smoothscale(full, size)
+            self.backgrounds[size] = full
+        return self.backgrounds[size]
+
+    def full_canvas(self):
+        """Shared offscreen surface for tables drawn at full detail"""
+        if self.canvas is None:
+            self.canvas = pygame.Surface((WIDTH, HEIGHT))
+        return self.canvas
+
+    def player_sprite(self, player, scale, detail, eyes):
+        """Sprite for a player; `eyes` is None while blinking, else a pupil step"""
+        key = (player.name, player.color, player.is_female, eyes, detail, scale)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            origin_x, origin_y = self.SPRITE_ORIGIN
+            model = Player(origin_x, origin_y, player.name, player.color, player.is_female)
+            model.is_blinking = eyes is None
+            model.eye_angle = (eyes or 0) * 2 * math.pi / SPECTATOR_EYE_PHASES
+            for hand in model.hands:
+                hand.hand_angle = 0
+            surface = pygame.Surface(self.SPRITE_SIZE, pygame.SRCALPHA)
+            model.draw(surface, detail)
+            size = (max(1, round(self.SPRITE_SIZE[0] * scale)), max(1, round(self.SPRITE_SIZE[1] * scale)))
+            sprite = pygame.transform.smoothscale(surface, size)
+            self.sprites[key] = sprite
+        return sprite
+
+    def text(self, text, color, max_width):
+        key = (text, color, max_width)
+        if key not in self.texts:
+            surface = create_arabic_surface(text, ARABIC_FONT_SMALL, color)
+            if surface.get_width() > max_width:
+                height = max(1, round(surface.get_height() * max_width / surface.get_width()))
+                surface = pygame.transform.smoothscale(surface, (max_width, height))
+            self.texts[key] = surface
+        return self.texts[key]
+
+
+class SpectatorTable:
+    """One table on the spectator wall: a RoundState played by a simple bot"""
+
+    MESSAGE_COLORS = {'start': BLUE, 'hidden': BLACK, 'correct': GREEN, 'wrong': RED}
+
+    def __init__(self):
+        self.players = create_players()
+        self.all_hands = []
+        for player in self.players:
+            self.all_hands.extend(player.hands)
+
+        self.round = RoundState(self.all_hands)
+        self.animation_timer = 0
+        self.next_action = random.randint(30, 180)
+        self.drawn_key = None
+
+    def update(self, sound_manager, detail):
+        # Low tiles show no blinks or moving pupils, so skip the player timers
+        if detail >= LOD_MEDIUM:
+            for player in self.players:
+                player.update(sound_manager)
+
+        if self.round.game_state == "result":
+            self.animation_timer += 1
+
+        # Bot: start a round, wait a bit, pick a hand, show the result
+        self.next_action -= 1
+        if self.next_action <= 0:
+            if self.round.game_state == "hiding":
+                self.round.guess(random.choice(self.all_hands))
+                self.animation_timer = 0
+                self.next_action = random.randint(120, 240)
+            else:
+                self.round.start_round()
+                self.next_action = random.randint(60, 180)
+
+    def ring_y(self, scale):
+        """Bobbing ring height, in tile pixels"""
+        bob = 8 * math.sin(self.animation_timer * 0.08)
+        return round((self.round.ring_hand.y - 40 + bob) * scale)
+
+    def player_eyes(self, player, detail):
+        """Pupil step for the sprite cache, or None while blinking"""
+        if detail >= LOD_MEDIUM:
+            if player.is_blinking:
+                return None
+            return int(player.eye_angle / (2 * math.pi) * SPECTATOR_EYE_PHASES) % SPECTATOR_EYE_PHASES
+        return 0
+
+    def visual_key(self, detail, scale):
+        """Everything that changes how the table looks at the given detail.
+
+        The ring bob and pupils are quantized (to tile pixels and pupil steps),
+        so small tiles redraw only when the animation visibly moves.
+        """
+        round_state = self.round
+        result = round_state.game_state == "result"
+        return (
+            round_state.game_state,
+            round_state.current_message,
+            self.all_hands.index(round_state.ring_hand) if result else None,
+            self.all_hands.index(round_state.selected_hand) if round_state.selected_hand else None,
+            self.ring_y(scale) if result else None,
+            tuple(self.player_eyes(player, detail) for player in self.players),
+        )
+
+    def needs_redraw(self, detail, scale):
+        """True if the table looks different from the last time it was drawn"""
+        if detail >= LOD_FULL:
+            return True
+        return self.visual_key(detail, scale) != self.drawn_key
+
+    def draw(self, tile, scale, detail, cache):
+        if detail >= LOD_FULL:
+            canvas = cache.full_canvas()
+            canvas.blit(cache.background((WIDTH, HEIGHT)), (0, 0))
+            for player in self.players:
+                player.draw(canvas, detail)
+            self.draw_status(canvas, 1.0, detail, cache)
+            pygame.transform.smoothscale(canvas, tile.get_size(), tile)
+        else:
+            tile.blit(cache.background(tile.get_size()), (0, 0))
+            origin_x, origin_y = cache.SPRITE_ORIGIN
+            for player in self.players:
+                sprite = cache.player_sprite(player, scale, detail, self.player_eyes(player, detail))
+                tile.blit(sprite, (round((player.x - origin_x) * scale), round((player.y - origin_y) * scale)))
+
+            # Sprites are drawn without the pulsing selection ring
+            selected = self.round.selected_hand
+            if selected:
+                pos = (round(selected.x * scale), round(selected.y * scale))
+                pygame.draw.circle(tile, GOLD, pos, max(2, round(25 * scale)), max(1, round(3 * scale)))
+
+            self.draw_status(tile, scale, detail, cache)
+            self.drawn_key = self.visual_key(detail, scale)
+
+    def draw_status(self, surface, scale, detail, cache):
+        """Draw the revealed ring and round message"""
+        round_state = self.round
+        if round_state.game_state == "result":
+            ring_x = round(round_state.ring_hand.x * scale)
+            ring_y = self.ring_y(scale)
+            pygame.draw.circle(surface, GOLD, (ring_x, ring_y), max(3, round(20 * scale)), max(1, round(4 * scale)))
+            pygame.draw.circle(surface, RED, (ring_x, ring_y), max(1, round(8 * scale)))
+
+        color = self.MESSAGE_COLORS[round_state.current_message]
+        width = surface.get_width()
+        if detail >= LOD_FULL:
+            text = ARABIC_TEXTS[round_state.current_message]
+            if round_state.game_state == "result":
+                text = f"{text} {round_state.winner_info}"
+            text_surface = create_arabic_surface(text, ARABIC_FONT, color)
+            surface.blit(text_surface, text_surface.get_rect(center=(width // 2, 120)))
+        elif detail >= LOD_MEDIUM:
+            text_surface = cache.text(ARABIC_TEXTS[round_state.current_message], color, width - 20)
+            surface.blit(text_surface, text_surface.get_rect(center=(width // 2, round(120 * scale))))
+        else:
+            pygame.draw.rect(surface, color, (0, 0, width, max(2, round(12 * scale))))
+
+
+class SpectatorWall:
+    """Show many independent tables at once in a tiled grid.
+
+    Each table gets a subsurface of the window. Small tiles use cached
+    sprites at a reduced level of detail and are only redrawn when their
+    table visibly changed (see SPECTATOR_LOD_NOTES for what still moves);
+    only the redrawn tiles are pushed to the display.
+    """
+
+    def __init__(self, table_count):
+        if table_count < 1:
+            raise ValueError("table_count must be at least 1")
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption(f"لعبة المحيبس - Spectator ({table_count})")
+        self.clock = pygame.time.Clock()
+
+        # Tables are silent; the hover sound is the only one Player.update can trigger
+        self.sound_manager = SoundManager()
+        self.sound_manager.sound_enabled = False
+
+        columns = math.ceil(math.sqrt(table_count))
+        rows = math.ceil(table_count / columns)
+        cell_width, cell_height = WIDTH // columns, HEIGHT // rows
+        self.scale = min(cell_width / WIDTH, cell_height / HEIGHT)
+        self.detail = lod_for_scale(self.scale)
+        tile_size = (int(WIDTH * self.scale), int(HEIGHT * self.scale))
+
+        self.cache = SpectatorSpriteCache()
+        self.tables = [SpectatorTable() for _ in range(table_count)]
+        self.tile_rects = []
+        self.tiles = []
+        for i in range(table_count):
+            column, row = i % columns, i // columns
+            rect = pygame.Rect(column * cell_width + (cell_width - tile_size[0]) // 2,
+                               row * cell_height + (cell_height - tile_size[1]) // 2, *tile_size)
+            self.tile_rects.append(rect)
+            self.tiles.append(self.screen.subsurface(rect))
+        self.redrawn = 0
+
+    def step(self):
+        """Advance every table one frame and return the screen rects that changed"""
+        dirty = []
+        for table, tile, rect in zip(self.tables, self.tiles, self.tile_rects):
+            table.update(self.sound_manager, self.detail)
+            if table.needs_redraw(self.detail, self.scale):
+                table.draw(tile, self.scale, self.detail, self.cache)
+                dirty.append(rect)
+        self.redrawn += len(dirty)
+        return dirty
+
+    def run(self):
+        self.screen.fill(BLACK)
+        pygame.display.flip()
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
+
+            dirty = self.step()
+            if dirty:
+                pygame.display.update(dirty)
+            self.clock.tick(FPS)
+
+        pygame.quit()
+        sys.exit()
+
+
+def run_spectator_benchmark(counts=SPECTATOR_BENCH_COUNTS, frames=SPECTATOR_BENCH_FRAMES):
+    """Time the spectator wall for each tile count without the FPS cap"""
+    details = set()
+    print(f"{'tables':>6} {'lod':>6} {'mean ms':>8} {'p95 ms':>8} {'fps':>8} {'redraw %':>9}")
+    for count in counts:
+        wall = SpectatorWall(count)
+        wall.screen.fill(BLACK)
+        pygame.display.flip()
+
+        # Warm up the sprite cache before timing
+        for _ in range(30):
+            wall.step()
+        wall.redrawn = 0
+
+        frame_times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            pygame.event.pump()
+            dirty = wall.step()
+            if dirty:
+                pygame.display.update(dirty)
+            frame_times.append((time.perf_counter() - start) * 1000)
+
+        frame_times.sort()
+        mean = sum(frame_times) / len(frame_times)
+        lod_name = {LOD_LOW: "low", LOD_MEDIUM: "medium", LOD_FULL: "full"}[wall.detail]
+        details.add(wall.detail)
+        print(f"{count:>6} {lod_name:>6} {mean:>8.2f} {percentile(frame_times, 95):>8.2f} "
+              f"{1000 / mean:>8.0f} {100 * wall.redrawn / (count * frames):>8.1f}%")
+    for detail in sorted(details, reverse=True):
+        print(SPECTATOR_LOD_NOTES[detail])
+    pygame.quit()
+
+
 if __name__ == "__main__":
+    if "--telemetry-report" in sys.argv:
+        print_round_report()
+        sys.exit()
+    if "--spectator-bench" in sys.argv:
+        run_spectator_benchmark()
+        sys.exit()
+    if "--spectator" in sys.argv:
+        index = sys.argv.index("--spectator")
+        try:
+            count = int(sys.argv[index + 1]) if index + 1 < len(sys.argv) else 16
+        except ValueError:
+            count = 0
+        if count < 1:
+            print("usage: python main.py --spectator [N]   (N = number of tables, a positive integer; default 16)")
+            sys.exit(2)
+        SpectatorWall(count).run()
     print("بدء تشغيل لعبة المحيبس - إختر اليد!")
     if not ARABIC_SUPPORT:
         print("⚠️  للحصول على أفضل عرض للنص العربي، ثبت:")